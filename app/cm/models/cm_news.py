@@ -3,13 +3,40 @@ Contains the CM's News models
 """
 from __future__ import annotations
 
+import re
 from typing import Union
-from lxml import html
+from lxml import etree, html
 from urllib.parse import urlparse
 
 from core.models import News
 from core.exceptions import UnsupportedNews
-from core.utils import datetime_from_string
+from core.utils import datetime_from_string, get_html_parser
+
+# Matches URLs of unsupported news types
+_UNSUPPORTED_NEWS_RE = re.compile(r"interativo|multimedia|perguntas")
+
+# XPath expressions are compiled once, at import time,
+# instead of being re-parsed for every news page
+_TITLE_XPATH = etree.XPath("//div[@class='centro']//h1//text()")
+
+# www.cmjornal.pt
+_CM_TEXT_XPATH = etree.XPath(
+    "//div[@class='texto_container paywall']//text()[not(ancestor::aside)][not(ancestor::div[@class='inContent'])][not(ancestor::blockquote)]"
+)
+_CM_OPINION_DESCRIPTION_XPATH = etree.XPath(
+    "//p[@class='destaques_lead']//text()"
+)
+_CM_DESCRIPTION_XPATH = etree.XPath("//strong[@class='lead']//text()")
+_CM_DATE_XPATH = etree.XPath("//span[@class='data']//text()")
+_CM_AUTHORS_XPATH = etree.XPath("//span[@class='autor']//text()")
+
+# www.vidas.pt
+_VIDAS_TEXT_XPATH = etree.XPath(
+    "//div[@class='text_container']//text()[not(ancestor::iframe)]"
+)
+_VIDAS_DESCRIPTION_XPATH = etree.XPath("//div[@class='lead']//text()")
+_VIDAS_DATE_XPATH = etree.XPath("//div[@class='data']//text()")
+_VIDAS_AUTHORS_XPATH = etree.XPath("//div[@class='autor']//text()")
 
 
 class CMNews(News):
@@ -19,51 +46,39 @@ class CMNews(News):
 
     @staticmethod
     def _parse_cm_news_info(html_tree, is_opinion):
-        text = html_tree.xpath(
-            "//div[@class='texto_container paywall']//text()[not(ancestor::aside)][not(ancestor::div[@class='inContent'])][not(ancestor::blockquote)]"
-        )
-        text = " ".join(text)
+        text = " ".join(_CM_TEXT_XPATH(html_tree))
 
         if is_opinion:
-            description = html_tree.xpath(
-                "//p[@class='destaques_lead']//text()"
-            )[0]
+            description = _CM_OPINION_DESCRIPTION_XPATH(html_tree)[0]
         else:
-            description = html_tree.xpath("//strong[@class='lead']//text()")[0]
+            description = _CM_DESCRIPTION_XPATH(html_tree)[0]
 
-        date = html_tree.xpath("//span[@class='data']//text()")[0].replace(
-            "às", ""
-        )
-        authors = html_tree.xpath("//span[@class='autor']//text()")
+        date = _CM_DATE_XPATH(html_tree)[0].replace("às", "")
+        authors = _CM_AUTHORS_XPATH(html_tree)
 
         return text, description, date, authors
 
     @staticmethod
     def _parse_vidas_news_info(html_tree, is_opinion):
 
-        text = html_tree.xpath(
-            "//div[@class='text_container']//text()[not(ancestor::iframe)]"
-        )
-        text = " ".join(text)
+        text = " ".join(_VIDAS_TEXT_XPATH(html_tree))
 
-        description = html_tree.xpath("//div[@class='lead']//text()")[0]
-        date = html_tree.xpath("//div[@class='data']//text()")[0].replace(
-            "•", ""
-        )
+        description = _VIDAS_DESCRIPTION_XPATH(html_tree)[0]
+        date = _VIDAS_DATE_XPATH(html_tree)[0].replace("•", "")
 
-        authors = html_tree.xpath("//div[@class='autor']//text()")
+        authors = _VIDAS_AUTHORS_XPATH(html_tree)
 
         return text, description, date, authors
 
     @classmethod
-    def from_html_string(cls, html_string: str) -> Union[CMNews]:
+    def from_html_string(cls, html_string: Union[str, bytes]) -> Union[CMNews]:
         """
         Builds a News object from a given URL.
 
         Parameters
         ----------
-        html_string : str
-            A news page HTML's string
+        html_string : str or bytes
+            A news page HTML's string (preferably the raw response bytes)
 
         Returns
         -------
@@ -77,28 +92,24 @@ class CMNews(News):
         """
 
         # Build HTML tree
-        tree = html.fromstring(html_string)
+        tree = html.fromstring(html_string, parser=get_html_parser())
 
         # Extract URL
-        try:
-            url = tree.xpath("//meta[@property='og:url']")[0].get("content")
-        except IndexError:
+        url_meta = tree.find(".//meta[@property='og:url']")
+        if url_meta is None:
             raise UnsupportedNews
+        url = url_meta.get("content")
 
         # If news is of type 'interativo', 'multimedia' or 'perguntas' raise exception
-        if any(
-            x in url
-            for x in [
-                "interativo",
-                "multimedia",
-                "perguntas",
-            ]
-        ):
+        if _UNSUPPORTED_NEWS_RE.search(url):
             raise UnsupportedNews
 
+        # Parse the URL once, both its path and netloc are needed
+        parsed_url = urlparse(url)
+
         try:
             # Get news section from url path and capitalize it
-            rubric = urlparse(url).path.split("/")[1].capitalize()
+            rubric = parsed_url.path.split("/", 2)[1].capitalize()
         except IndexError:
             raise UnsupportedNews
 
@@ -107,7 +118,7 @@ class CMNews(News):
 
         # CM has subjornals with different HTML's (e.g. Vidas - www.vidas.pt)
         # Needs custom webscrapping for each subjornal
-        parsed_url_netloc = urlparse(url).netloc
+        parsed_url_netloc = parsed_url.netloc
         if parsed_url_netloc == "www.cmjornal.pt":
             parse_func = CMNews._parse_cm_news_info
         elif parsed_url_netloc == "www.vidas.pt":
@@ -130,13 +141,12 @@ class CMNews(News):
         # to ISO 8601 format.
         date = datetime_from_string(date).isoformat()
         # Remove ads in case they exist
-        text = text.split("Para aceder a todos os Exclusivos CM")[0].split(
-            "Ler o artigo completo"
-        )[0]
+        text = text.partition("Para aceder a todos os Exclusivos CM")[0]
+        text = text.partition("Ler o artigo completo")[0]
         # CM text contains extra white, aswell as carriage
         text = " ".join(text.split())
         # Find title
-        title = tree.xpath("//div[@class='centro']//h1//text()")[0]
+        title = _TITLE_XPATH(tree)[0]
 
         return cls(
             title,
@@ -3,7 +3,7 @@ Module containg the concrete CMNewsFactory
 """
 import requests
 import os
-import json
+from typing import Union
 
 from core.mixins import (
     URLSearchMixin,
@@ -12,6 +12,7 @@ from core.mixins import (
 )
 from core.models import NewsFactory
 from core.exceptions import UnsupportedNews
+from core.utils import build_session, json_loads, REQUEST_TIMEOUT
 
 from .cm_news import CMNews
 
@@ -34,7 +35,7 @@ class CMNewsFactory(
         """
 
         # Create session
-        session = requests.Session()
+        session = build_session()
 
         payload = {
             "email": os.getenv("CM_USER", ""),
@@ -45,19 +46,37 @@ class CMNewsFactory(
         resp = session.post(
             "https://aminhaconta.xl.pt/Async/Site/LoginHandler/LOGIN_WITH_THIRDPARTY",
             data=payload,
+            timeout=REQUEST_TIMEOUT,
         )
-        json_response = json.loads(resp.text)
+        json_response = json_loads(resp.content)
         if not json_response["Success"]:
             token = ""
         else:
-            token = json.loads(resp.text)["Data"]["LOGIN_TOKEN"]
+            token = json_response["Data"]["LOGIN_TOKEN"]
 
         session.get(
-            f"https://www.cmjornal.pt/login/login?token={token}&returnUrl=https://www.cmjornal.pt"
+            f"https://www.cmjornal.pt/login/login?token={token}&returnUrl=https://www.cmjornal.pt",
+            timeout=REQUEST_TIMEOUT,
         )
 
         return session
 
+    def _build_news(self, url: str) -> Union[CMNews, None]:
+        """
+        Fetches a CM news URL and builds a CMNews object.
+        Returns `None` if the URL is invalid or the news is unsupported.
+        """
+        response = self._get_news_page(url)
+        # If invalid URL
+        if response is None:
+            return None
+
+        try:
+            return CMNews.from_html_string(response.content)
+        # Catch unsupported news
+        except UnsupportedNews:
+            return None
+
     def url_search(self, urls: list[str]) -> list[CMNews]:
         """
         Iterates over a list of CM news URLs
@@ -72,17 +91,4 @@ class CMNewsFactory(
         -------
         CMNews: list
         """
-        news_obj_list = []
-        for url in urls:
-            # If valid URL
-            if self._validate_url(url):
-                response = self.session.get(url)
-                try:
-                    news_obj = CMNews.from_html_string(response.text)
-                    news_obj_list.append(news_obj)
-                # Catch unsupported news
-                # Continue
-                except UnsupportedNews:
-                    continue
-
-        return news_obj_list
+        return self._build_news_list(self._build_news, urls)
@@ -3,6 +3,8 @@ Contains the core mixins that concrete news factorys should inherit to implement
 a functionality
 """
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Union
 
 from .models import News
 
@@ -29,8 +31,8 @@ class TagSearchMixin(ABC):
     def tag_search(
         self,
         tags: list[str],
-        starting_date: str,
-        ending_date: str,
+        starting_date: Union[str, date],
+        ending_date: Union[str, date],
     ) -> list[News]:
         """
         Abstract method that child classes must implement
@@ -47,8 +49,8 @@ class KeywordSearchMixin(ABC):
     def keyword_search(
         self,
         keywords: list[str],
-        starting_date: str,
-        ending_date: str,
+        starting_date: Union[str, date],
+        ending_date: Union[str, date],
     ) -> list[News]:
         """
         Abstract method that child classes must implement
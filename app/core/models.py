@@ -2,7 +2,8 @@
 Contains the core news models
 """
 from __future__ import annotations
-from typing import Union
+from typing import Callable, Union
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 from abc import (
@@ -11,6 +12,8 @@ from abc import (
     abstractstaticmethod,
 )
 
+from .utils import REQUEST_TIMEOUT
+
 
 class News(ABC):
     """
@@ -61,8 +64,23 @@ class News(ABC):
         self.authors = authors
         self.text = text
 
+    def to_dict(self) -> dict:
+        """
+        Returns the news fields as a plain dict.
+        """
+        return {
+            "title": self.title,
+            "description": self.description,
+            "url": self.url,
+            "rubric": self.rubric,
+            "is_opinion": self.is_opinion,
+            "date": self.date,
+            "authors": self.authors,
+            "text": self.text,
+        }
+
     @abstractclassmethod
-    def from_html_string(cls, html_string: str) -> Union[News]:
+    def from_html_string(cls, html_string: Union[str, bytes]) -> Union[News]:
         """
         Child classes must implement 'from_html_string' to build a news object from a news html page.
         Might return `None` is that news is not supported.
@@ -74,6 +92,9 @@ class NewsFactory(ABC):
     Abstract news factory
     """
 
+    # Maximum number of news pages fetched concurrently
+    max_workers = 10
+
     def __init__(self) -> None:
         # Empty list for storing found news
         self.found_news = []
@@ -87,8 +108,57 @@ class NewsFactory(ABC):
         and return the login session.
         """
 
-    def _validate_url(self, url: str) -> bool:
+    def _get_news_page(self, url: str) -> Union[requests.Response, None]:
         """
-        Validates than a given URL returns a 200 status code
+        Fetches a news page with the login session.
+        Returns `None` if the request fails or the page doesn't
+        return a 200 status code.
         """
-        return self.session.get(url).status_code == 200
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        return response
+
+    def _build_news_list(
+        self,
+        build_func: Callable[[str], Union[News, None]],
+        urls: list[str],
+    ) -> list[News]:
+        """
+        Calls `build_func` on each URL concurrently and collects the built news.
+
+        Fetching news pages is network bound, so the requests are
+        spread over a bounded pool of threads sharing the login session.
+        URLs for which `build_func` returns `None` are skipped, news are
+        deduplicated by URL and the order of `urls` is kept.
+
+        Parameters
+        ----------
+        build_func: callable
+            Builds a News object from a URL, or returns `None` if unsupported
+        urls: list of str
+            List of news URLs
+
+        Returns
+        -------
+        News: list
+        """
+        # Remove duplicated URLs before fetching them
+        urls = list(dict.fromkeys(urls))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            news_list = executor.map(build_func, urls)
+
+        # Different URLs may lead to the same news (e.g. query parameters),
+        # keep only the first news found for each canonical URL
+        found_news = []
+        seen_urls = set()
+        for news_obj in news_list:
+            if news_obj is not None and news_obj.url not in seen_urls:
+                seen_urls.add(news_obj.url)
+                found_news.append(news_obj)
+
+        return found_news
@@ -0,0 +1,26 @@
+"""
+Contains the core API renderers
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson, much faster than the standard
+    library json module when rendering responses with many news
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        # Write UTC datetimes with a 'Z' suffix, like DRF's JSON encoder
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+        # Indent when asked to (e.g. by the browsable API)
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            option |= orjson.OPT_INDENT_2
+
+        return orjson.dumps(data, option=option)
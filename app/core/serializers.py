@@ -108,7 +108,7 @@ class JobResultSerializer(serializers.Serializer):
     def to_internal_value(self, data):
 
         # Create serializer with list of instances
-        data = [vars(instance) for instance in data]
+        data = [instance.to_dict() for instance in data]
         serializer = NewsSerializer(data=data, many=True)
         if serializer.is_valid():
             return {
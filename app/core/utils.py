@@ -1,7 +1,71 @@
 import dateparser
+import requests
+import threading
 from datetime import datetime, date
+from functools import lru_cache
+from lxml import html
+from orjson import loads as json_loads  # noqa Parses bytes, faster than json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# (connect, read) timeout, in seconds, for every HTTP request
+REQUEST_TIMEOUT = (3, 15)
 
+# Holds one HTML parser per thread, lxml serializes parses
+# made with the same parser object
+_thread_local = threading.local()
+
+
+def get_html_parser() -> html.HTMLParser:
+    """
+    Returns the current thread's HTML parser, avoids setting up a new parser
+    for every news page. Blank text and comments are dropped to keep the
+    parsed trees small. The page's declared charset is kept.
+    """
+    parser = getattr(_thread_local, "html_parser", None)
+    if parser is None:
+        parser = html.HTMLParser(
+            remove_blank_text=True,
+            remove_comments=True,
+            collect_ids=False,
+        )
+        _thread_local.html_parser = parser
+    return parser
+
+
+def build_session() -> requests.Session:
+    """
+    Creates a 'requests.Session' with a pooled HTTP adapter, so that
+    connections are kept alive and reused, and transient 5xx responses
+    are retried with backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared session for requests that don't need a login
+_session = build_session()
+
+
+def get_session() -> requests.Session:
+    """Returns the shared 'requests.Session' for requests without login"""
+    return _session
+
+
+# News listings repeat the same dates a lot, cache the parsed results
+@lru_cache(maxsize=4096)
 def datetime_from_string(date_string: str, order="DMY") -> datetime:
     """Parses a str to datetime. Assumes format: dd/mm/YYYY by default"""
 
@@ -11,3 +75,12 @@ def datetime_from_string(date_string: str, order="DMY") -> datetime:
         date_string,
         settings={"DATE_ORDER": order},
     )
+
+
+def date_from_string(date_string: str, order="DMY") -> date:
+    """Parses a str to date. Already parsed dates are returned as they are"""
+
+    parsed = datetime_from_string(date_string, order=order)
+    if isinstance(parsed, datetime):
+        return parsed.date()
+    return parsed
@@ -4,14 +4,28 @@ Contains the Publico's News models
 from __future__ import annotations
 
 import requests
-import json
 
+from functools import lru_cache
 from typing import Union
-from lxml import html
+from lxml import etree, html
 from urllib.parse import urlparse
 
 from core.models import News
 from core.exceptions import UnsupportedNews
+from core.utils import (
+    get_html_parser,
+    get_session,
+    json_loads,
+    REQUEST_TIMEOUT,
+)
+
+# Text of the news body paragraphs, quotes and headings, leaving out
+# asides and supplemental slots. Compiled once, at import time
+_TEXT_XPATH = etree.XPath(
+    "//div[@class='story__body']//p//text()[not(ancestor::aside)][not(ancestor::div[contains(@class, 'supplemental-slot')])]"
+    " | //div[@class='story__body']//blockquote//text()[not(ancestor::aside)][not(ancestor::div[contains(@class, 'supplemental-slot')])]"
+    " | //div[@class='story__body']//*[self::h1 or self::h2 or self::h3 or self::h4]//text()[not(ancestor::aside)][not(ancestor::div[contains(@class, 'supplemental-slot')])]"
+)
 
 
 class PublicoNews(News):
@@ -19,15 +33,47 @@ class PublicoNews(News):
     Publico's news model
     """
 
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def get_summary(news_id: int) -> dict:
+        """
+        Fetches a news summary from Publico's API.
+        Summaries are cached by news id, since the same news is looked up
+        when validating its URL and again when building it.
+
+        Parameters
+        ----------
+        news_id : int
+            The Publico's news id
+
+        Returns
+        -------
+        dict
+            The news summary
+
+        Raises
+        ------
+        requests.RequestException
+            If the request fails or doesn't return a 200 status code
+        """
+        response = get_session().get(
+            f"https://api.publico.pt/content/summary/scriptor_noticias/{news_id}",
+            timeout=REQUEST_TIMEOUT,
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+
     @classmethod
-    def from_html_string(cls, html_string: str) -> Union[PublicoNews]:
+    def from_html_string(
+        cls, html_string: Union[str, bytes]
+    ) -> Union[PublicoNews]:
         """
         Builds a News object from a given URL.
 
         Parameters
         ----------
-        html_string : str
-            A news page HTML's string
+        html_string : str or bytes
+            A news page HTML's string (preferably the raw response bytes)
 
         Returns
         -------
@@ -37,29 +83,31 @@ class PublicoNews(News):
         Raises
         ------
         UnsupportedNews
-            If news is minute updated.
+            If news is minute updated or has no summary.
         """
 
         # Build HTML tree
-        tree = html.fromstring(html_string)
+        tree = html.fromstring(html_string, parser=get_html_parser())
 
         # Extract URL
-        url = tree.xpath("//meta[@property='og:url']")[0].get("content")
+        url = tree.find(".//meta[@property='og:url']").get("content")
 
         # Extract news id
-        news_id = urlparse(url).path.split("-")[-1]
+        try:
+            news_id = int(urlparse(url).path.rpartition("-")[2])
+        except ValueError:
+            raise UnsupportedNews
 
-        # Make GET request to publico news summary API endpoint
-        response = requests.get(
-            f"https://api.publico.pt/content/summary/scriptor_noticias/{news_id}"
-        )
-        # Load json response
-        json_doc = json.loads(response.text)
+        # Get the news summary from publico API
+        try:
+            json_doc = cls.get_summary(news_id)
+        except requests.RequestException:
+            raise UnsupportedNews
 
         # If minute updated news, raise Unsupported News
-        minuteUpdated = tree.xpath("//span[@class='label label--live']")
+        minuteUpdated = tree.find(".//span[@class='label label--live']")
 
-        if len(minuteUpdated) != 0:
+        if minuteUpdated is not None:
             raise UnsupportedNews
 
         # Extract description
@@ -76,15 +124,7 @@ class PublicoNews(News):
         date = json_doc["data"]
 
         # Extract text
-        text = " ".join(
-            tree.xpath(
-                (
-                    "//div[@class='story__body']//p//text()[not(ancestor::aside)][not(ancestor::div[contains(@class, 'supplemental-slot')])] | \
-                //div[@class='story__body']//blockquote//text()[not(ancestor::aside)][not(ancestor::div[contains(@class, 'supplemental-slot')])]  | \
-                //div[@class='story__body']//*[self::h1 or self::h2 or self::h3 or self::h4]//text()[not(ancestor::aside)][not(ancestor::div[contains(@class, 'supplemental-slot')])]"
-                )
-            )
-        ).replace(
+        text = " ".join(_TEXT_XPATH(tree)).replace(
             "Subscreva gratuitamente as newsletters e receba o melhor da actualidade e os trabalhos mais profundos do Público.",
             "",
         )
@@ -3,9 +3,10 @@ Module containg the concrete PublicoNewsFactory
 """
 import requests
 import os
-import json
-from urllib.parse import urlparse
+from urllib.parse import urlparse, quote
 import itertools
+from typing import Union
+from datetime import date
 
 
 from core.models import NewsFactory
@@ -15,7 +16,12 @@ from core.mixins import (
     KeywordSearchMixin,
 )
 from core.exceptions import UnsupportedNews
-from core.utils import datetime_from_string
+from core.utils import (
+    date_from_string,
+    build_session,
+    json_loads,
+    REQUEST_TIMEOUT,
+)
 
 from .publico_news import PublicoNews
 
@@ -30,6 +36,10 @@ class PublicoNewsFactory(
     Performs and stores different types of search in Publico's website
     """
 
+    # Each news needs two requests (summary API and news page),
+    # allow more of them in flight
+    max_workers = 16
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -43,36 +53,49 @@ class PublicoNewsFactory(
             "password": os.getenv("PUBLICO_PW"),
         }
         login_url = "https://www.publico.pt/api/user/login"
-        session = requests.Session()
+        session = build_session()
         session.headers.update(
             {
                 "user-agent": "Mozilla/5.0 (Windows NT 6.1; WOW64; rv:40.0) Gecko/20100101 Firefox/40.1",
             }
         )
         # send POST request to login
-        session.post(login_url, data=login_payload)
+        session.post(login_url, data=login_payload, timeout=REQUEST_TIMEOUT)
         return session
 
     def _validate_url(self, url: str) -> bool:
         # First we try to obtain news id from url
+        # and check if is integer (try parse)
         try:
-            news_id = urlparse(url).path.split("-")[-1]
-        except IndexError:
+            news_id = int(urlparse(url).path.rpartition("-")[2])
+        except ValueError:
             return False
 
-        # Check if is integer (try parse)
+        # Check that the news summary exists (the result is cached)
         try:
-            news_id = int(news_id)
-        except ValueError:
+            PublicoNews.get_summary(news_id)
+        except requests.RequestException:
             return False
+        return True
 
-        # Make a request with this id and check for valid response (200)
-        response = requests.get(
-            f"https://api.publico.pt/content/summary/scriptor_noticias/{news_id}"
-        )
-        if not response.status_code == 200:
-            return False
-        return super()._validate_url(url)
+    def _build_news(self, url: str) -> Union[PublicoNews, None]:
+        """
+        Fetches a Publico news URL and builds a PublicoNews object.
+        Returns `None` if the URL is invalid or the news is unsupported.
+        """
+        # If invalid URL
+        if not self._validate_url(url):
+            return None
+
+        response = self._get_news_page(url)
+        if response is None:
+            return None
+
+        try:
+            return PublicoNews.from_html_string(response.content)
+        # Catch unsupported news
+        except UnsupportedNews:
+            return None
 
     def url_search(self, urls: list[str]) -> list[PublicoNews]:
         """
@@ -88,27 +111,14 @@ class PublicoNewsFactory(
         -------
         PublicoNews: list
         """
-        news_obj_list = []
-        for url in urls:
-            # If valid URL
-            if self._validate_url(url):
-                response = self.session.get(url)
-                try:
-                    news_obj = PublicoNews.from_html_string(response.text)
-                    news_obj_list.append(news_obj)
-                # Catch unsupported news
-                # Continue
-                except UnsupportedNews:
-                    continue
-
-        return news_obj_list
+        return self._build_news_list(self._build_news, urls)
 
     def _tag_search(
         self,
         tag: str,
-        starting_date: str,
-        ending_date: str,
-    ) -> list[PublicoNews]:
+        starting_date: date,
+        ending_date: date,
+    ) -> list[str]:
 
         # Normalize tag
         tag = tag.replace(" ", "-").lower()
@@ -119,39 +129,27 @@ class PublicoNewsFactory(
         # Create news URL list
         collected_news_urls = []
 
-        # Parse `starting_date`
-        starting_date = datetime_from_string(starting_date, order="YMD").date()
-        # Parse `ending_date`
-        ending_date = datetime_from_string(ending_date, order="YMD").date()
-
-        while (
-            response := requests.get(
-                f"https://www.publico.pt/api/list/{tag}?page={page_number}"
-            ).text
-        ) != "[]":
-            # Read the json data
-            data = json.loads(response)
+        # Build the listing URL once, only the page number changes
+        api_url = f"https://www.publico.pt/api/list/{quote(tag)}?page={{}}"
+
+        # Read the json data of each page, until an empty page is returned
+        while data := json_loads(
+            self.session.get(
+                api_url.format(page_number), timeout=REQUEST_TIMEOUT
+            ).content
+        ):
             # iterate over each news dict
             for item in data:
+                # Parse the news date once
+                news_date = date_from_string(item.get("data"), order="YMD")
+
                 # If news out of lower bound date, stop the search
-                if (
-                    datetime_from_string(
-                        item.get("data"),
-                        order="YMD",
-                    ).date()
-                    < starting_date
-                ):
+                if news_date < starting_date:
                     stop_entire_search = True  # Will break main loop
                     break  # Will break current loop
 
                 # If news more recent that end date, SKIP AHEAD
-                elif (
-                    datetime_from_string(
-                        item.get("data"),
-                        order="YMD",
-                    ).date()
-                    > ending_date
-                ):
+                elif news_date > ending_date:
                     continue
 
                 # If news inside the date rage, collect the URL
@@ -167,8 +165,8 @@ class PublicoNewsFactory(
     def tag_search(
         self,
         tags: list[str],
-        starting_date: str,
-        ending_date: str,
+        starting_date: Union[str, date],
+        ending_date: Union[str, date],
     ) -> list[PublicoNews]:
         """
         Performs a tag search of Publico news between the date range,
@@ -176,9 +174,9 @@ class PublicoNewsFactory(
 
         Parameters
         ----------
-        starting_date: str
+        starting_date: str or date
             The starting search date
-        ending_date: str
+        ending_date: str or date
             The ending search date
         tags: list of str
             The tags to search for
@@ -187,6 +185,10 @@ class PublicoNewsFactory(
         PublicoNews: list
         """
 
+        # Parse the dates once for all tags
+        starting_date = date_from_string(starting_date, order="YMD")
+        ending_date = date_from_string(ending_date, order="YMD")
+
         # Collect urls from each tag
         news_urls = [
             self._tag_search(tag, starting_date, ending_date) for tag in tags
@@ -203,9 +205,9 @@ class PublicoNewsFactory(
     def _keyword_search(
         self,
         keyword: str,
-        starting_date: str,
-        ending_date: str,
-    ) -> list[PublicoNews]:
+        starting_date: date,
+        ending_date: date,
+    ) -> list[str]:
 
         # Normalize keyword
         keyword = keyword.lower()
@@ -214,18 +216,21 @@ class PublicoNewsFactory(
         # Create news URL list
         collected_news_urls = []
 
-        # Parse `starting_date`
-        starting_date = datetime_from_string(starting_date, order="YMD")
-        # Parse `ending_date`
-        ending_date = datetime_from_string(ending_date, order="YMD")
-
-        while (
-            response := requests.get(
-                f"https://www.publico.pt/api/list/search/?query={keyword}&start={starting_date.strftime('%d-%m-%Y')}&end={ending_date.strftime('%d-%m-%Y')}&page={page_number}"
-            ).text
-        ) != "[]":
-            # Read the json data
-            data = json.loads(response)
+        # Build the search URL once, only the page number changes
+        api_url = (
+            "https://www.publico.pt/api/list/search/"
+            f"?query={quote(keyword)}"
+            f"&start={starting_date.strftime('%d-%m-%Y')}"
+            f"&end={ending_date.strftime('%d-%m-%Y')}"
+            "&page={}"
+        )
+
+        # Read the json data of each page, until an empty page is returned
+        while data := json_loads(
+            self.session.get(
+                api_url.format(page_number), timeout=REQUEST_TIMEOUT
+            ).content
+        ):
             # Get the URLs (this search type needs fullUrl)
             urls = [d.get("fullUrl") for d in data]
             # Append URLs to list
@@ -238,8 +243,8 @@ class PublicoNewsFactory(
     def keyword_search(
         self,
         keywords: list[str],
-        starting_date: str,
-        ending_date: str,
+        starting_date: Union[str, date],
+        ending_date: Union[str, date],
     ) -> list[PublicoNews]:
         """
         Performs a keyword search of Publico news between the date range,
@@ -248,9 +253,9 @@ class PublicoNewsFactory(
         Parameters
         ----------
 
-        starting_date: str
+        starting_date: str or date
             The starting search date
-        ending_date: str
+        ending_date: str or date
             The ending search date
         keywords: list of str
             A list of keywords to search for.
@@ -259,6 +264,10 @@ class PublicoNewsFactory(
         -------
         PublicoNews: list
         """
+        # Parse the dates once for all keywords
+        starting_date = date_from_string(starting_date, order="YMD")
+        ending_date = date_from_string(ending_date, order="YMD")
+
         # Collect urls from each keyword
         news_urls = [
             self._keyword_search(
@@ -189,6 +189,47 @@ class PublicoURLSearchAPITest(TestCase):
             self.assertIn("text", news)
             self.assertTrue(isinstance(news["text"], str))
 
+    def test_repeated_url_search(self):
+        """
+        Tests if repeated Publico news URLs in the same job
+        are only webscraped once.
+        """
+        response = self.api.post(
+            reverse("publico_url_search"),
+            {
+                "urls": [
+                    "https://www.publico.pt/2021/01/31/politica/noticia/chega-pede-demissao-conselho-directivo-inem-1948705",
+                    "https://www.publico.pt/2021/01/31/politica/noticia/chega-pede-demissao-conselho-directivo-inem-1948705",
+                    "https://www.publico.pt/2021/01/31/politica/noticia/chega-pede-demissao-conselho-directivo-inem-1948705?ref=hp",
+                ]
+            },
+            format="json",
+        )
+
+        # Assert that a `job_id` is returned
+        self.assertIn("job_id", response.data)
+
+        # Assert that a `results_url` is returned
+        self.assertIn("results_url", response.data)
+
+        # Make the worker dispatch all jobs in sync mode
+        get_worker().work(burst=True)
+
+        # Now make the request to get the results
+        response = self.api.get(response.data["results_url"])
+
+        # Assert that response is status code 200
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_200_OK,
+        )
+
+        # Number of news should be in response
+        self.assertIn("number_of_news", response.data)
+
+        # Number of news should be 1
+        self.assertEqual(response.data["number_of_news"], 1)
+
     def test_minute_update_url_search(self):
         """
         Tests if Publico minute updated news are being skipped.
@@ -64,8 +64,8 @@ class PublicoTagSearchView(APIView):
             # Enqueue job
             job_id = django_rq.enqueue(
                 PublicoNewsFactory().tag_search,
-                starting_date=serializer.data["starting_date"],
-                ending_date=serializer.data["ending_date"],
+                starting_date=serializer.validated_data["starting_date"],
+                ending_date=serializer.validated_data["ending_date"],
                 tags=serializer.data["tags"],
             ).id
             # Create a job serializer
@@ -100,8 +100,8 @@ class PublicoKeywordSearchView(APIView):
             # Enqueue job
             job_id = django_rq.enqueue(
                 PublicoNewsFactory().keyword_search,
-                starting_date=serializer.data["starting_date"],
-                ending_date=serializer.data["ending_date"],
+                starting_date=serializer.validated_data["starting_date"],
+                ending_date=serializer.validated_data["ending_date"],
                 keywords=serializer.data["keywords"],
             ).id
             # Create a job serializer
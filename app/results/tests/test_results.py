@@ -2,6 +2,7 @@
 Contains tests for results API
 """
 import datetime
+import json
 from django.test import TestCase
 from rest_framework.test import APIClient
 from django.urls import reverse
@@ -10,6 +11,7 @@ from django_rq import get_worker
 from django.utils.timezone import now
 
 from core.utils import datetime_from_string
+from publico.models import PublicoNews
 
 
 class ResultsAPITest(TestCase):
@@ -105,3 +107,94 @@ class ResultsAPITest(TestCase):
             < datetime.timedelta(seconds=1)
         )
         self.assertIn("news", response.data)
+
+    def test_rendered_job_response(self):
+        """
+        Tests the JSON rendered for a job's results,
+        as sent to the client.
+        """
+        response = self.api.post(
+            reverse("publico_url_search"),
+            {
+                "urls": [
+                    "https://www.publico.pt/2021/01/31/economia/noticia/irs-contribuintes-podem-validar-agregado-familiar-ate-15-fevereiro-1948701"
+                ],
+            },
+        )
+
+        # here we dispatch the worker so that job gets done in sync mode
+        get_worker().work(burst=True)
+        results_url = response.data["results_url"]
+        response = self.api.get(results_url, HTTP_ACCEPT="application/json")
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_200_OK,
+        )
+        self.assertEqual(response["Content-Type"], "application/json")
+
+        # Decode the rendered content, not `response.data`
+        content = json.loads(response.content)
+
+        # UTC dates are rendered with a 'Z' suffix
+        self.assertTrue(content["date"].endswith("Z"))
+
+        self.assertEqual(content["number_of_news"], 1)
+        self.assertEqual(len(content["news"]), 1)
+        self.assertEqual(
+            set(content["news"][0]),
+            {
+                "title",
+                "description",
+                "url",
+                "rubric",
+                "is_opinion",
+                "date",
+                "authors",
+                "text",
+            },
+        )
+
+        # Not indented by default
+        self.assertNotIn(b"\n", response.content)
+
+        # Indented when asked to
+        response = self.api.get(
+            results_url,
+            HTTP_ACCEPT="application/json; indent=2",
+        )
+        self.assertIn(b"\n", response.content)
+        # Same news (the results `date` is regenerated on each request)
+        self.assertEqual(
+            json.loads(response.content)["news"],
+            content["news"],
+        )
+
+    def test_news_to_dict(self):
+        """
+        Tests that `News.to_dict` returns the news fields.
+        """
+        news = PublicoNews(
+            "title",
+            "description",
+            "https://www.publico.pt/",
+            "rubric",
+            "2021-01-31T10:00:00+00:00",
+            ["author"],
+            False,
+            "text",
+        )
+
+        self.assertEqual(
+            news.to_dict(),
+            {
+                "title": "title",
+                "description": "description",
+                "url": "https://www.publico.pt/",
+                "rubric": "rubric",
+                "is_opinion": False,
+                "date": "2021-01-31T10:00:00+00:00",
+                "authors": ["author"],
+                "text": "text",
+            },
+        )
@@ -5,11 +5,16 @@ import django_rq
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.renderers import BrowsableAPIRenderer
 
+from core.renderers import ORJSONRenderer
 from core.serializers import JobResultSerializer
 
 
 class ResultsView(APIView):
+    # Results may hold hundreds of news, render them with orjson
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
     def get(self, request, job_id, *args, **kwargs):
         """
         Returns the results of a job